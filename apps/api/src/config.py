@@ -1,13 +1,25 @@
 """Application configuration."""
 
+from contextlib import suppress
+from functools import lru_cache
+import hashlib
+import json
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Final
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import URL, make_url
 
-# Get the apps/api directory (parent of src/)
-API_DIR = Path(__file__).parent.parent
-ENV_FILE = API_DIR / ".env"
+# Get the apps/api directory (parent of src/), absolute so nothing depends on the CWD
+API_DIR: Final = Path(__file__).resolve().parent.parent
+ENV_FILE: Final = API_DIR / ".env"
+# Validated settings from the last cold start, keyed by a fingerprint of their inputs
+SETTINGS_CACHE_FILE: Final = API_DIR / ".env.cache.json"
+
+# Async driver for each supported database backend
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
 
 
 class Settings(BaseSettings):
@@ -31,6 +43,14 @@ class Settings(BaseSettings):
     # API
     api_v1_prefix: str = "/api/v1"
 
+    @field_validator("db_path")
+    @classmethod
+    def resolve_db_path(cls, value: str) -> str:
+        """Resolve a relative DB_PATH against apps/api/ instead of the working directory."""
+        if not value or Path(value).is_absolute():
+            return value
+        return str(API_DIR / value)
+
     @property
     def database_url(self) -> str:
         """SQLAlchemy/SQLModel database URL."""
@@ -42,6 +62,16 @@ class Settings(BaseSettings):
             raise ValueError(msg)
         return f"sqlite:///{self.db_path}"
 
+    @property
+    def async_database_url(self) -> URL:
+        """SQLAlchemy/SQLModel database URL using the backend's async driver."""
+        url = make_url(self.database_url)
+        backend = url.get_backend_name()
+        if backend not in ASYNC_DRIVERS:
+            msg = f"Unsupported database backend for async engine: {backend}"
+            raise ValueError(msg)
+        return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
     @property
     def prisma_database_url(self) -> str:
         """Prisma database URL (same database as SQLAlchemy/SQLModel)."""
@@ -54,7 +84,84 @@ class Settings(BaseSettings):
         return f"file:{self.db_path}"
 
 
-settings = Settings()
+def _file_fingerprint(path: Path) -> str:
+    """Return a hash of the contents of `path`, empty if it is missing.
+
+    Stat metadata is not enough: a same-length edit within the filesystem's mtime
+    granularity would keep serving stale values. Reading the small file is cheap;
+    parsing and validating it is what the cache saves.
+    """
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
+def _settings_cache_key() -> str:
+    """Fingerprint every input of Settings: .env, environment variables and this module.
+
+    The module itself is included so that editing a default or a validator in code
+    invalidates values cached under the old definition.
+    """
+    # case_sensitive=False: environment variables match field names case-insensitively
+    environ = {
+        name.lower(): value
+        for name, value in os.environ.items()
+        if name.lower() in Settings.model_fields
+    }
+    # Relative DB_PATH values are resolved against API_DIR, so a moved checkout is a miss
+    payload = json.dumps(
+        [str(API_DIR), _file_fingerprint(ENV_FILE), _file_fingerprint(Path(__file__)), environ],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_settings() -> Settings:
+    """Load settings, reusing the cached validated values when the inputs are unchanged."""
+    key = _settings_cache_key()
+    try:
+        cached = json.loads(SETTINGS_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = None
+
+    if (
+        isinstance(cached, dict)
+        and cached.get("key") == key
+        and isinstance(cached.get("settings"), dict)
+    ):
+        # Values were validated when the cache was written, skip validation
+        return Settings.model_construct(**cached["settings"])
+
+    # Read the same ENV_FILE the cache key fingerprints
+    loaded = Settings(_env_file=ENV_FILE)  # type: ignore[call-arg]
+    # The cache is best-effort: a read-only checkout just falls back to parsing every time
+    with suppress(OSError):
+        tmp_file = SETTINGS_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(
+            json.dumps({"key": key, "settings": loaded.model_dump(mode="json")}),
+            encoding="utf-8",
+        )
+        tmp_file.replace(SETTINGS_CACHE_FILE)
+    return loaded
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance."""
+    return load_settings()
+
+
+if TYPE_CHECKING:
+    settings: Settings
+
 
-# Set DATABASE_URL environment variable for Prisma
-os.environ.setdefault("DATABASE_URL", settings.prisma_database_url)
+def __getattr__(name: str) -> Settings:
+    """Construct `settings` lazily on first access (PEP 562)."""
+    if name == "settings":
+        loaded = get_settings()
+        # Bind the module global so later lookups bypass __getattr__
+        globals()["settings"] = loaded
+        return loaded
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
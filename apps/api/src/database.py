@@ -1,36 +1,98 @@
 """Database connection and session management."""
 
-from collections.abc import AsyncGenerator
+from contextvars import ContextVar
+from typing import TypeVar
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import HTTPException, status
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from config import settings
+from db_engine import AsyncSessionLocal, engine
 
-# Convert database URL to async version
-database_url = settings.database_url
-if database_url.startswith("sqlite"):
-    database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://")
-elif database_url.startswith("postgresql"):
-    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
+ModelT = TypeVar("ModelT")
 
-# Create async database engine
-engine = create_async_engine(
-    database_url,
-    echo=settings.debug,
-)
+# Columns the models leave to the database's server default on INSERT
+SERVER_DEFAULT_COLUMNS = ("created_at", "updated_at")
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+# Sessions opened while handling the current request, keyed by their factory
+_request_sessions: ContextVar[dict[async_sessionmaker[AsyncSession], AsyncSession] | None] = (
+    ContextVar("request_sessions", default=None)
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+class DBSessionMiddleware:
+    """ASGI middleware that closes the request's database sessions after the response."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Scope database sessions to one HTTP request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sessions: dict[async_sessionmaker[AsyncSession], AsyncSession] = {}
+        token = _request_sessions.set(sessions)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_sessions.reset(token)
+            for session in sessions.values():
+                await session.close()
+
+
+def request_session(session_factory: async_sessionmaker[AsyncSession]) -> AsyncSession:
+    """Get the current request's session from the factory, opening it on first use."""
+    sessions = _request_sessions.get()
+    if sessions is None:
+        msg = "No request scope. Add DBSessionMiddleware to the application first."
+        raise RuntimeError(msg)
+    session = sessions.get(session_factory)
+    if session is None:
+        session = sessions[session_factory] = session_factory()
+    return session
+
+
+async def get_db() -> AsyncSession:
     """Get async database session dependency."""
-    async with AsyncSessionLocal() as session:
-        yield session
+    return request_session(AsyncSessionLocal)
+
+
+async def get_or_404(db: AsyncSession, model: type[ModelT], ident: int) -> ModelT:
+    """Load a row by primary key, raising 404 if it does not exist.
+
+    Session.get() checks the identity map first and otherwise runs a plain PK lookup.
+    """
+    instance = await db.get(model, ident)
+    if instance is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{model.__name__} not found",
+        )
+    return instance
+
+
+def check_server_defaults(conn: Connection) -> None:
+    """Fail fast if the 'user' table predates the created_at/updated_at server defaults.
+
+    create_all never alters an existing table, and without the defaults every INSERT
+    would fail its NOT NULL constraint.
+    """
+    missing = [
+        column["name"]
+        for column in inspect(conn).get_columns("user")
+        if column["name"] in SERVER_DEFAULT_COLUMNS and column.get("default") is None
+    ]
+    if missing:
+        msg = (
+            f"Table 'user' has no server default for {', '.join(missing)}. "
+            "It was created by an older schema; delete the database at DB_PATH "
+            "and restart to recreate it."
+        )
+        raise RuntimeError(msg)
 
 
 async def init_db() -> None:
@@ -39,3 +101,4 @@ async def init_db() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(check_server_defaults)
@@ -0,0 +1,57 @@
+"""Async database engine shared by SQLAlchemy and SQLModel.
+
+Both ORMs read/write the same database file, so they share one engine and
+connection pool instead of opening two pools that contend for the SQLite file lock.
+Each ORM keeps its own metadata registry.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import ConnectionPoolEntry
+
+from config import settings
+
+# WAL turns each commit into a log append instead of an fsync'd rollback journal,
+# and lets readers proceed while a write is in progress
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache
+)
+
+database_url = settings.async_database_url
+
+# Create async database engine
+engine = create_async_engine(
+    database_url,
+    echo=settings.debug,
+    # Only for SQLite
+    connect_args=(
+        {"check_same_thread": False} if database_url.get_backend_name() == "sqlite" else {}
+    ),
+)
+
+
+def _set_sqlite_pragmas(
+    dbapi_connection: DBAPIConnection,
+    _connection_record: ConnectionPoolEntry,
+) -> None:
+    """Apply SQLITE_PRAGMAS to each new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+if database_url.get_backend_name() == "sqlite":
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
@@ -3,10 +3,11 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
 
 from config import settings
-from database import init_db
+from database import DBSessionMiddleware, init_db
 from database_sqlmodel import init_db as init_db_sqlmodel
 from routers import users_router
 from routers.users_prisma import close_prisma, init_prisma
@@ -14,13 +15,22 @@ from routers.users_prisma import router as users_prisma_router
 from routers.users_sqlmodel import router as users_sqlmodel_router
 
 
+async def init_tables() -> None:
+    """Create SQLAlchemy and SQLModel tables.
+
+    Both calls create the same 'user' table on the shared engine (idempotent), so they
+    run one after the other rather than racing each other.
+    """
+    await init_db()  # SQLAlchemy tables
+    await init_db_sqlmodel()  # SQLModel tables (same schema, same DB file)
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for startup and shutdown events."""
-    # Startup
-    # Both init_db() calls create the same 'user' table (idempotent)
-    await init_db()  # SQLAlchemy tables
-    await init_db_sqlmodel()  # SQLModel tables (same schema, same DB file)
+    # Startup: connect Prisma only after the tables (and their schema check) succeed,
+    # so a startup error propagates as-is and never leaves a half-open Prisma client
+    await init_tables()
     await init_prisma()
     yield
     # Shutdown
@@ -33,12 +43,18 @@ app = FastAPI(
     version=settings.app_version,
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Include routers
-app.include_router(users_router, prefix=settings.api_v1_prefix)
-app.include_router(users_prisma_router, prefix=settings.api_v1_prefix)
-app.include_router(users_sqlmodel_router, prefix=settings.api_v1_prefix)
+# Close request-scoped database sessions once the response has been sent
+app.add_middleware(DBSessionMiddleware)
+
+# Compose the versioned API once, then mount it on the app in a single include
+api_router = APIRouter(prefix=settings.api_v1_prefix)
+api_router.include_router(users_router)
+api_router.include_router(users_prisma_router)
+api_router.include_router(users_sqlmodel_router)
+app.include_router(api_router)
 
 
 @app.get("/")
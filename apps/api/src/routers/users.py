@@ -1,76 +1,84 @@
 """User API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import bindparam, delete, lambda_stmt, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
+from database import get_db, get_or_404
 from my_sqlalchemy.models import User
-from schemas import UserCreate, UserListItem, UserResponse, UserUpdate
+from schemas import USER_LIST_ADAPTER, UserCreate, UserListItem, UserResponse, UserUpdate
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# INSERT construct with ON CONFLICT DO NOTHING ... RETURNING, per backend in ASYNC_DRIVERS
+_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+# Lookup statement built and cached once; values are bound per call
+_emails_by_email_or_username = lambda_stmt(
+    lambda: select(User.email).where(
+        or_(User.email == bindparam("email"), User.username == bindparam("username"))
+    )
+)
+
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)) -> User:
     """Create a new user."""
-    # Check if user with email already exists
-    result = await db.execute(select(User).where(User.email == user.email))
-    db_user = result.scalar_one_or_none()
-    if db_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
+    # Insert in one round trip; a unique conflict yields no row instead of an error
+    insert = _INSERTS[db.get_bind().dialect.name]
+    result = await db.execute(
+        insert(User)
+        .values(
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            hashed_password=user.hashed_password,  # In production, hash the password!
+            is_active=user.is_active,
         )
-
-    # Check if username already exists
-    result = await db.execute(select(User).where(User.username == user.username))
-    db_user = result.scalar_one_or_none()
-    if db_user:
+        .on_conflict_do_nothing()
+        .returning(User)
+    )
+    new_user = result.scalar_one_or_none()
+    if new_user is None:
+        # Find out which unique constraint was hit
+        result = await db.execute(
+            _emails_by_email_or_username, {"email": user.email, "username": user.username}
+        )
+        if user.email in result.scalars().all():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken",
         )
 
-    # Create new user
-    new_user = User(
-        email=user.email,
-        username=user.username,
-        full_name=user.full_name,
-        hashed_password=user.hashed_password,  # In production, hash the password!
-        is_active=user.is_active,
-    )
-    db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
     return new_user
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(user_id: int, db: AsyncSession = Depends(get_db)) -> User:
     """Get a user by ID."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    db_user = result.scalar_one_or_none()
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-    return db_user
+    return await get_or_404(db, User, user_id)
 
 
 @router.get("/", response_model=list[UserListItem])
 async def list_users(
     skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> list[UserListItem]:
+) -> Response:
     """List all users with pagination (returns minimal fields)."""
     # Select only required fields for better performance
     result = await db.execute(
         select(User.id, User.username, User.created_at).offset(skip).limit(limit)
     )
-    return [
-        UserListItem.model_validate(row, from_attributes=True) for row in result.all()
-    ]
+    # Rows come from our own database: build items without re-validation and
+    # serialize the page in one call (FastAPI skips response_model for a Response)
+    users = [UserListItem.model_construct(**row) for row in result.mappings()]
+    return Response(USER_LIST_ADAPTER.dump_json(users), media_type="application/json")
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
@@ -78,7 +86,11 @@ async def update_user(
     user_id: int, user_update: UserUpdate, db: AsyncSession = Depends(get_db)
 ) -> User:
     """Update a user."""
-    result = await db.execute(select(User).where(User.id == user_id))
+    # Update only provided fields; RETURNING yields no row for an unknown ID
+    update_data = user_update.model_dump(exclude_unset=True)
+    result = await db.execute(
+        update(User).where(User.id == user_id).values(**update_data).returning(User)
+    )
     db_user = result.scalar_one_or_none()
     if not db_user:
         raise HTTPException(
@@ -86,26 +98,18 @@ async def update_user(
             detail="User not found",
         )
 
-    # Update only provided fields
-    update_data = user_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_user, field, value)
-
     await db.commit()
-    await db.refresh(db_user)
     return db_user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)) -> None:
     """Delete a user."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    db_user = result.scalar_one_or_none()
-    if not db_user:
+    result = await db.execute(delete(User).where(User.id == user_id).returning(User.id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    await db.delete(db_user)
     await db.commit()
@@ -1,24 +1,20 @@
 """User API endpoints using Prisma ORM."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from prisma import Prisma
+from fastapi import APIRouter, HTTPException, Response, status
 from prisma.errors import UniqueViolationError
+from prisma.models import User
 from prisma.partials import UserMinimal
 
+from config import settings
 from my_prisma import PrismaManager
-from schemas import UserCreate, UserListItem, UserResponse, UserUpdate
+from schemas import USER_LIST_ADAPTER, UserCreate, UserListItem, UserResponse, UserUpdate
 
 router = APIRouter(prefix="/prisma/users", tags=["users-prisma"])
 
 
-async def get_prisma_client() -> Prisma:
-    """Get Prisma client instance as a dependency."""
-    return PrismaManager.get()
-
-
 async def init_prisma() -> None:
     """Initialize Prisma client (called from lifespan)."""
-    await PrismaManager.init()
+    await PrismaManager.init(database_url=settings.prisma_database_url)
 
 
 async def close_prisma() -> None:
@@ -26,22 +22,28 @@ async def close_prisma() -> None:
     await PrismaManager.close()
 
 
-def prisma_to_response(prisma_user: dict) -> dict:
-    """Convert Prisma model to response schema (now using snake_case)."""
-    return {
-        "id": prisma_user["id"],
-        "email": prisma_user["email"],
-        "username": prisma_user["username"],
-        "full_name": prisma_user.get("full_name"),
-        "is_active": prisma_user["is_active"],
-        "created_at": prisma_user["created_at"],
-        "updated_at": prisma_user["updated_at"],
-    }
+def prisma_to_response(prisma_user: User) -> UserResponse:
+    """Convert Prisma model to response schema (now using snake_case).
+
+    Reads attributes straight off the Prisma model instead of dumping it to a dict first,
+    and uses model_construct instead of model_validate on the way in. FastAPI still
+    validates the result against response_model=UserResponse when serializing it.
+    """
+    return UserResponse.model_construct(
+        id=prisma_user.id,
+        email=prisma_user.email,
+        username=prisma_user.username,
+        full_name=prisma_user.full_name,
+        is_active=prisma_user.is_active,
+        created_at=prisma_user.created_at,
+        updated_at=prisma_user.updated_at,
+    )
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def create_user(user: UserCreate, prisma: Prisma = Depends(get_prisma_client)) -> dict:
+async def create_user(user: UserCreate) -> UserResponse:
     """Create a new user using Prisma."""
+    prisma = PrismaManager.get()
 
     try:
         new_user = await prisma.user.create(
@@ -53,7 +55,7 @@ async def create_user(user: UserCreate, prisma: Prisma = Depends(get_prisma_clie
                 "is_active": user.is_active,
             }
         )
-        return prisma_to_response(new_user.model_dump())
+        return prisma_to_response(new_user)
     except UniqueViolationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -62,8 +64,9 @@ async def create_user(user: UserCreate, prisma: Prisma = Depends(get_prisma_clie
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int, prisma: Prisma = Depends(get_prisma_client)) -> dict:
+async def get_user(user_id: int) -> UserResponse:
     """Get a user by ID using Prisma."""
+    prisma = PrismaManager.get()
 
     db_user = await prisma.user.find_unique(where={"id": user_id})
     if not db_user:
@@ -71,71 +74,62 @@ async def get_user(user_id: int, prisma: Prisma = Depends(get_prisma_client)) ->
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    return prisma_to_response(db_user.model_dump())
+    return prisma_to_response(db_user)
 
 
 @router.get("/", response_model=list[UserListItem])
-async def list_users(
-    skip: int = 0, limit: int = 100, prisma: Prisma = Depends(get_prisma_client)
-) -> list[UserListItem]:
+async def list_users(skip: int = 0, limit: int = 100) -> Response:
     """List all users with pagination using Prisma with field-level SELECT."""
+    prisma = PrismaManager.get()
     # Use partial type to select only needed fields at DB level
     users = await UserMinimal.prisma(prisma).find_many(
         skip=skip,
         take=limit,
     )
-    # Return only minimal fields for list response
-    return [
-        UserListItem(id=user.id, username=user.username, created_at=user.created_at)
+    # Return only minimal fields for list response, serialized without re-validation
+    items = [
+        UserListItem.model_construct(id=user.id, username=user.username, created_at=user.created_at)
         for user in users
     ]
+    return Response(USER_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
-async def update_user(
-    user_id: int, user_update: UserUpdate, prisma: Prisma = Depends(get_prisma_client)
-) -> dict:
+async def update_user(user_id: int, user_update: UserUpdate) -> UserResponse:
     """Update a user using Prisma."""
-
-    # Check if user exists
-    db_user = await prisma.user.find_unique(where={"id": user_id})
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
+    prisma = PrismaManager.get()
 
     # Build update data (now using snake_case, no conversion needed)
     update_data = user_update.model_dump(exclude_unset=True)
 
     try:
+        # update() returns None when no record matches, so no existence probe is needed
         updated_user = await prisma.user.update(
             where={"id": user_id},
             data=update_data,  # type: ignore[arg-type]
         )
-        if updated_user:
-            return prisma_to_response(updated_user.model_dump())
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
     except UniqueViolationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email or username already taken",
         ) from e
+    if not updated_user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    return prisma_to_response(updated_user)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(user_id: int, prisma: Prisma = Depends(get_prisma_client)) -> None:
+async def delete_user(user_id: int) -> None:
     """Delete a user using Prisma."""
+    prisma = PrismaManager.get()
 
-    # Check if user exists
-    db_user = await prisma.user.find_unique(where={"id": user_id})
-    if not db_user:
+    # delete() returns None when no record matches
+    deleted_user = await prisma.user.delete(where={"id": user_id})
+    if not deleted_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-
-    await prisma.user.delete(where={"id": user_id})
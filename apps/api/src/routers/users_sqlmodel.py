@@ -1,12 +1,13 @@
 """User API endpoints using SQLModel."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from database import get_or_404
 from database_sqlmodel import get_db
 from my_sqlmodel import User
-from schemas import UserCreate, UserListItem, UserResponse, UserUpdate
+from schemas import USER_LIST_ADAPTER, UserCreate, UserListItem, UserResponse, UserUpdate
 
 router = APIRouter(prefix="/sqlmodel/users", tags=["users-sqlmodel"])
 
@@ -49,28 +50,22 @@ async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)) -> U
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(user_id: int, db: AsyncSession = Depends(get_db)) -> User:
     """Get a user by ID using SQLModel."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    db_user = result.scalar_one_or_none()
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-    return db_user
+    return await get_or_404(db, User, user_id)
 
 
 @router.get("/", response_model=list[UserListItem])
 async def list_users(
     skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> list[UserListItem]:
+) -> Response:
     """List all users with pagination using SQLModel (returns minimal fields)."""
     # Select only required fields for better performance
     result = await db.execute(
         select(User.id, User.username, User.created_at).offset(skip).limit(limit)
     )
-    return [
-        UserListItem.model_validate(row, from_attributes=True) for row in result.all()
-    ]
+    # Rows come from our own database: build items without re-validation and
+    # serialize the page in one call (FastAPI skips response_model for a Response)
+    users = [UserListItem.model_construct(**row) for row in result.mappings()]
+    return Response(USER_LIST_ADAPTER.dump_json(users), media_type="application/json")
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
@@ -78,13 +73,7 @@ async def update_user(
     user_id: int, user_update: UserUpdate, db: AsyncSession = Depends(get_db)
 ) -> User:
     """Update a user using SQLModel."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    db_user = result.scalar_one_or_none()
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
+    db_user = await get_or_404(db, User, user_id)
 
     # Update only provided fields
     update_data = user_update.model_dump(exclude_unset=True)
@@ -99,13 +88,7 @@ async def update_user(
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)) -> None:
     """Delete a user using SQLModel."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    db_user = result.scalar_one_or_none()
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
+    db_user = await get_or_404(db, User, user_id)
 
     await db.delete(db_user)
     await db.commit()
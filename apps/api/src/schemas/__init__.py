@@ -1,5 +1,11 @@
 """Pydantic schemas for API request/response models."""
 
-from schemas.user import UserCreate, UserListItem, UserResponse, UserUpdate
+from schemas.user import (
+    USER_LIST_ADAPTER,
+    UserCreate,
+    UserListItem,
+    UserResponse,
+    UserUpdate,
+)
 
-__all__ = ["UserCreate", "UserListItem", "UserResponse", "UserUpdate"]
+__all__ = ["USER_LIST_ADAPTER", "UserCreate", "UserListItem", "UserResponse", "UserUpdate"]
@@ -2,11 +2,11 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
 
 
-class UserBase(BaseModel):
-    """Base user schema with common fields."""
+class UserInput(BaseModel):
+    """Base schema for user-supplied fields (validated)."""
 
     email: EmailStr
     username: str = Field(..., min_length=3, max_length=100)
@@ -14,7 +14,19 @@ class UserBase(BaseModel):
     is_active: bool = True
 
 
-class UserCreate(UserBase):
+class UserOutputBase(BaseModel):
+    """Base schema for user fields read back from the database.
+
+    Values were validated on the way in, so plain types skip the email check per row.
+    """
+
+    email: str
+    username: str
+    full_name: str | None = None
+    is_active: bool = True
+
+
+class UserCreate(UserInput):
     """Schema for creating a new user."""
 
     hashed_password: str = Field(..., min_length=8)
@@ -39,7 +51,11 @@ class UserListItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
-class UserResponse(UserBase):
+# Serializes list pages in one call; validators are compiled once at import
+USER_LIST_ADAPTER = TypeAdapter(list[UserListItem])
+
+
+class UserResponse(UserOutputBase):
     """Schema for user detail response."""
 
     id: int
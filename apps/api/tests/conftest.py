@@ -1,11 +1,24 @@
 """Pytest configuration and fixtures."""
 
-from collections.abc import AsyncGenerator, Generator
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+import os
+import sys
 
-from fastapi.testclient import TestClient
+import httpx
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import ConnectionPoolEntry, StaticPool
 from sqlmodel import SQLModel
 
 # Import User model to register it with Base
@@ -17,34 +30,98 @@ from my_sqlmodel.models import (
     User as SQLModelUser,  # noqa: F401  # type: ignore[reportUnusedImport]
 )
 
-# Use in-memory SQLite for testing
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Use named shared-cache in-memory SQLite databases for testing. Unlike ":memory:",
+# every connection to the same name sees the same database, and StaticPool keeps
+# one connection open so the database lives for the whole run.
+# Names are keyed on the pytest-xdist worker so `pytest -n auto` workers never share one.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+SQLALCHEMY_DATABASE_URL = (
+    f"sqlite+aiosqlite:///file:test_sqlalchemy_{XDIST_WORKER}?mode=memory&cache=shared&uri=true"
+)
+SQLMODEL_DATABASE_URL = (
+    f"sqlite+aiosqlite:///file:test_sqlmodel_{XDIST_WORKER}?mode=memory&cache=shared&uri=true"
+)
 
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     echo=False,
+    poolclass=StaticPool,
+    # Every test rolls its own transaction back, so skip the pool's reset-on-checkin
+    pool_reset_on_return=None,
 )
+# Sessions join the per-test transaction; their commits only release a SAVEPOINT
 TestingSessionLocal = async_sessionmaker(
-    engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    join_transaction_mode="create_savepoint",
 )
 
 # SQLModel engine for testing
 sqlmodel_engine = create_async_engine(
-    SQLALCHEMY_DATABASE_URL,
+    SQLMODEL_DATABASE_URL,
     echo=False,
+    poolclass=StaticPool,
+    pool_reset_on_return=None,
 )
-SQLModelTestingSessionLocal = async_sessionmaker(
-    sqlmodel_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+
+
+def _disable_pysqlite_transactions(
+    dbapi_connection: DBAPIConnection,
+    _connection_record: ConnectionPoolEntry,
+) -> None:
+    """Stop the sqlite3 driver from managing transactions itself.
+
+    Otherwise the first SAVEPOINT starts the transaction and its RELEASE commits it,
+    so the per-test rollback would not undo anything.
+    """
+    dbapi_connection.isolation_level = None  # type: ignore[attr-defined]
+
+
+# Durability is irrelevant for a throwaway test database
+TEST_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA locking_mode=EXCLUSIVE",
 )
 
 
-@pytest_asyncio.fixture(scope="function", autouse=True)
+def _set_test_pragmas(
+    dbapi_connection: DBAPIConnection,
+    _connection_record: ConnectionPoolEntry,
+) -> None:
+    """Apply TEST_SQLITE_PRAGMAS to each new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in TEST_SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _emit_begin(conn: Connection) -> None:
+    """Emit BEGIN explicitly since the driver no longer does."""
+    conn.exec_driver_sql("BEGIN")
+
+
+for test_engine in (engine, sqlmodel_engine):
+    event.listen(test_engine.sync_engine, "connect", _disable_pysqlite_transactions)
+    event.listen(test_engine.sync_engine, "connect", _set_test_pragmas)
+    event.listen(test_engine.sync_engine, "begin", _emit_begin)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the session's single event loop on uvloop where it is available."""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+
+    import uvloop
+
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
 async def setup_database() -> AsyncGenerator[None, None]:
-    """Create tables before each test."""
+    """Create tables once for the whole test session."""
     # Create SQLAlchemy tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -64,23 +141,41 @@ async def setup_database() -> AsyncGenerator[None, None]:
         await conn.run_sync(SQLModel.metadata.drop_all)
 
 
+@asynccontextmanager
+async def rollback_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Open a session inside a transaction that is rolled back afterwards."""
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = TestingSessionLocal(bind=conn)
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
 @pytest_asyncio.fixture
 async def db() -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session for each test."""
-    async with TestingSessionLocal() as session:
+    """Create test database session for each test (rolled back afterwards)."""
+    async with rollback_session(engine) as session:
         yield session
 
 
 @pytest_asyncio.fixture
 async def sqlmodel_db() -> AsyncGenerator[AsyncSession, None]:
-    """Create test SQLModel database session for each test."""
-    async with SQLModelTestingSessionLocal() as session:
+    """Create test SQLModel database session for each test (rolled back afterwards)."""
+    async with rollback_session(sqlmodel_engine) as session:
         yield session
 
 
-@pytest.fixture
-def client(db: AsyncSession, sqlmodel_db: AsyncSession) -> Generator[TestClient, None, None]:
-    """Create test client with database dependency override."""
+@pytest_asyncio.fixture
+async def ac(
+    db: AsyncSession, sqlmodel_db: AsyncSession
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create async HTTP client with database dependency override.
+
+    Talks to the app in the test's own event loop, without TestClient's thread portal.
+    """
     from database import get_db
     from database_sqlmodel import get_db as get_sqlmodel_db
     from main import app
@@ -94,7 +189,9 @@ def client(db: AsyncSession, sqlmodel_db: AsyncSession) -> Generator[TestClient,
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_sqlmodel_db] = override_get_sqlmodel_db
 
-    with TestClient(app) as test_client:
-        yield test_client
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
 
     app.dependency_overrides.clear()
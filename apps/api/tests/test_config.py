@@ -0,0 +1,92 @@
+"""Tests for the cached settings loader."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import config
+from config import Settings, load_settings
+
+
+@pytest.fixture
+def env_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the loader at a scratch .env and cache file, with no settings in the environment."""
+    env_file = tmp_path / ".env"
+    monkeypatch.setattr(config, "ENV_FILE", env_file)
+    monkeypatch.setattr(config, "SETTINGS_CACHE_FILE", tmp_path / ".env.cache.json")
+    for name in Settings.model_fields:
+        monkeypatch.delenv(name.upper(), raising=False)
+    return env_file
+
+
+def test_load_settings_cache_hit(env_file: Path) -> None:
+    """Test that unchanged inputs reuse the cached values without re-validating."""
+    env_file.write_text("APP_NAME=From Env\n", encoding="utf-8")
+    assert load_settings().app_name == "From Env"
+
+    # Tamper with the cached values but keep the key: a hit returns them as-is
+    cached = json.loads(config.SETTINGS_CACHE_FILE.read_text(encoding="utf-8"))
+    cached["settings"]["app_name"] = "From Cache"
+    config.SETTINGS_CACHE_FILE.write_text(json.dumps(cached), encoding="utf-8")
+
+    assert load_settings().app_name == "From Cache"
+
+
+def test_load_settings_miss_after_env_file_change(env_file: Path) -> None:
+    """Test that editing .env invalidates the cache."""
+    env_file.write_text("APP_NAME=First\n", encoding="utf-8")
+    assert load_settings().app_name == "First"
+
+    env_file.write_text("APP_NAME=Second value\n", encoding="utf-8")
+    assert load_settings().app_name == "Second value"
+
+
+def test_load_settings_miss_after_same_size_edit(env_file: Path) -> None:
+    """Test that a same-length .env edit with an unchanged mtime still invalidates the cache."""
+    env_file.write_text("APP_NAME=abc\n", encoding="utf-8")
+    assert load_settings().app_name == "abc"
+    stat = env_file.stat()
+
+    env_file.write_text("APP_NAME=xyz\n", encoding="utf-8")
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_settings().app_name == "xyz"
+
+
+def test_load_settings_miss_after_env_var_change(
+    env_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that changing a matching environment variable invalidates the cache."""
+    env_file.write_text("APP_NAME=From Env File\n", encoding="utf-8")
+    assert load_settings().app_name == "From Env File"
+
+    monkeypatch.setenv("APP_NAME", "From Environment")
+    assert load_settings().app_name == "From Environment"
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["not json", "[]", '{"key": null}'],
+    ids=["invalid-json", "wrong-type", "missing-settings"],
+)
+def test_load_settings_corrupt_cache(env_file: Path, content: str) -> None:
+    """Test that an unreadable cache falls back to parsing and is rewritten."""
+    env_file.write_text("APP_NAME=From Env\n", encoding="utf-8")
+    config.SETTINGS_CACHE_FILE.write_text(content, encoding="utf-8")
+
+    assert load_settings().app_name == "From Env"
+    cached = json.loads(config.SETTINGS_CACHE_FILE.read_text(encoding="utf-8"))
+    assert cached["settings"]["app_name"] == "From Env"
+
+
+def test_load_settings_corrupt_cache_with_matching_key(env_file: Path) -> None:
+    """Test that a cache entry with the current key but no values is not trusted."""
+    env_file.write_text("APP_NAME=From Env\n", encoding="utf-8")
+    load_settings()
+    cached = json.loads(config.SETTINGS_CACHE_FILE.read_text(encoding="utf-8"))
+    config.SETTINGS_CACHE_FILE.write_text(
+        json.dumps({"key": cached["key"], "settings": None}), encoding="utf-8"
+    )
+
+    assert load_settings().app_name == "From Env"
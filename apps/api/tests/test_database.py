@@ -0,0 +1,107 @@
+"""Tests for the request-scoped database sessions."""
+
+from collections.abc import AsyncGenerator
+
+from fastapi import Depends, FastAPI
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database import DBSessionMiddleware, check_server_defaults, get_db, request_session
+from database_sqlmodel import get_db as get_sqlmodel_db
+from db_engine import AsyncSessionLocal
+
+
+@pytest.fixture
+def closed_sessions(monkeypatch: pytest.MonkeyPatch) -> list[AsyncSession]:
+    """Record every AsyncSession.close() call, in order."""
+    closed: list[AsyncSession] = []
+    original_close = AsyncSession.close
+
+    async def recording_close(self: AsyncSession) -> None:
+        closed.append(self)
+        await original_close(self)
+
+    monkeypatch.setattr(AsyncSession, "close", recording_close)
+    return closed
+
+
+@pytest_asyncio.fixture
+async def session_app(
+    closed_sessions: list[AsyncSession],
+) -> AsyncGenerator[tuple[httpx.AsyncClient, list[tuple[AsyncSession, AsyncSession]]], None]:
+    """Serve a route that depends on both real get_db functions, with no overrides."""
+    seen: list[tuple[AsyncSession, AsyncSession]] = []
+    app = FastAPI()
+    app.add_middleware(DBSessionMiddleware)
+
+    @app.get("/sessions")
+    async def sessions(
+        db: AsyncSession = Depends(get_db),
+        sqlmodel_db: AsyncSession = Depends(get_sqlmodel_db),
+    ) -> dict[str, int]:
+        seen.append((db, sqlmodel_db))
+        return {"closed": len(closed_sessions)}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client, seen
+
+
+@pytest.mark.asyncio
+async def test_request_session_shared_and_closed(
+    session_app: tuple[httpx.AsyncClient, list[tuple[AsyncSession, AsyncSession]]],
+    closed_sessions: list[AsyncSession],
+) -> None:
+    """Test one session per request, shared by both get_db functions, closed afterwards."""
+    client, seen = session_app
+
+    response = await client.get("/sessions")
+    assert response.status_code == 200
+    # Still open while the handler runs
+    assert response.json() == {"closed": 0}
+
+    db, sqlmodel_db = seen[0]
+    assert db is sqlmodel_db
+    assert closed_sessions == [db]
+
+    # The next request gets a fresh session
+    await client.get("/sessions")
+    next_db, _ = seen[1]
+    assert next_db is not db
+    assert closed_sessions == [db, next_db]
+
+
+@pytest.mark.asyncio
+async def test_request_session_requires_middleware() -> None:
+    """Test that sessions cannot be opened outside of a DBSessionMiddleware request."""
+    with pytest.raises(RuntimeError, match="DBSessionMiddleware"):
+        request_session(AsyncSessionLocal)
+
+    with pytest.raises(RuntimeError, match="DBSessionMiddleware"):
+        await get_db()
+
+
+@pytest.mark.asyncio
+async def test_check_server_defaults_rejects_old_schema() -> None:
+    """Test that a 'user' table without timestamp server defaults fails with a clear error."""
+    # The schema created_at/updated_at had before the database filled them on INSERT
+    metadata = MetaData()
+    Table(
+        "user",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("created_at", DateTime, nullable=False),
+        Column("updated_at", DateTime, nullable=False),
+    )
+    old_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with old_engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+            with pytest.raises(RuntimeError, match="created_at, updated_at"):
+                await conn.run_sync(check_server_defaults)
+    finally:
+        await old_engine.dispose()
@@ -1,12 +1,14 @@
 """Tests for user endpoints."""
 
 from fastapi import status
-from fastapi.testclient import TestClient
+import httpx
+import pytest
 
 
-def test_create_user(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_create_user(ac: httpx.AsyncClient) -> None:
     """Test creating a new user."""
-    response = client.post(
+    response = await ac.post(
         "/api/v1/users/",
         json={
             "email": "test@example.com",
@@ -25,7 +27,8 @@ def test_create_user(client: TestClient) -> None:
     assert "created_at" in data
 
 
-def test_create_user_duplicate_email(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_create_user_duplicate_email(ac: httpx.AsyncClient) -> None:
     """Test creating a user with duplicate email."""
     user_data = {
         "email": "test@example.com",
@@ -33,16 +36,17 @@ def test_create_user_duplicate_email(client: TestClient) -> None:
         "hashed_password": "hashedpassword123",
     }
     # Create first user
-    client.post("/api/v1/users/", json=user_data)
+    await ac.post("/api/v1/users/", json=user_data)
 
     # Try to create second user with same email
     user_data["username"] = "different_username"
-    response = client.post("/api/v1/users/", json=user_data)
+    response = await ac.post("/api/v1/users/", json=user_data)
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json()["detail"] == "Email already registered"
 
 
-def test_create_user_duplicate_username(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_create_user_duplicate_username(ac: httpx.AsyncClient) -> None:
     """Test creating a user with duplicate username."""
     user_data = {
         "email": "test@example.com",
@@ -50,19 +54,20 @@ def test_create_user_duplicate_username(client: TestClient) -> None:
         "hashed_password": "hashedpassword123",
     }
     # Create first user
-    client.post("/api/v1/users/", json=user_data)
+    await ac.post("/api/v1/users/", json=user_data)
 
     # Try to create second user with same username
     user_data["email"] = "different@example.com"
-    response = client.post("/api/v1/users/", json=user_data)
+    response = await ac.post("/api/v1/users/", json=user_data)
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json()["detail"] == "Username already taken"
 
 
-def test_get_user(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_get_user(ac: httpx.AsyncClient) -> None:
     """Test getting a user by ID."""
     # Create a user
-    create_response = client.post(
+    create_response = await ac.post(
         "/api/v1/users/",
         json={
             "email": "test@example.com",
@@ -73,25 +78,27 @@ def test_get_user(client: TestClient) -> None:
     user_id = create_response.json()["id"]
 
     # Get the user
-    response = client.get(f"/api/v1/users/{user_id}")
+    response = await ac.get(f"/api/v1/users/{user_id}")
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert data["id"] == user_id
     assert data["email"] == "test@example.com"
 
 
-def test_get_user_not_found(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_get_user_not_found(ac: httpx.AsyncClient) -> None:
     """Test getting a non-existent user."""
-    response = client.get("/api/v1/users/999")
+    response = await ac.get("/api/v1/users/999")
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert response.json()["detail"] == "User not found"
 
 
-def test_list_users(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_list_users(ac: httpx.AsyncClient) -> None:
     """Test listing all users."""
     # Create multiple users
     for i in range(3):
-        client.post(
+        await ac.post(
             "/api/v1/users/",
             json={
                 "email": f"test{i}@example.com",
@@ -101,7 +108,7 @@ def test_list_users(client: TestClient) -> None:
         )
 
     # List users
-    response = client.get("/api/v1/users/")
+    response = await ac.get("/api/v1/users/")
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert len(data) == 3
@@ -112,11 +119,12 @@ def test_list_users(client: TestClient) -> None:
     assert "email" not in data[0]  # email should not be in list response
 
 
-def test_list_users_pagination(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_list_users_pagination(ac: httpx.AsyncClient) -> None:
     """Test listing users with pagination."""
     # Create multiple users
     for i in range(5):
-        client.post(
+        await ac.post(
             "/api/v1/users/",
             json={
                 "email": f"test{i}@example.com",
@@ -126,7 +134,7 @@ def test_list_users_pagination(client: TestClient) -> None:
         )
 
     # List with pagination
-    response = client.get("/api/v1/users/?skip=2&limit=2")
+    response = await ac.get("/api/v1/users/?skip=2&limit=2")
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert len(data) == 2
@@ -136,10 +144,11 @@ def test_list_users_pagination(client: TestClient) -> None:
     assert "created_at" in data[0]
 
 
-def test_update_user(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_update_user(ac: httpx.AsyncClient) -> None:
     """Test updating a user."""
     # Create a user
-    create_response = client.post(
+    create_response = await ac.post(
         "/api/v1/users/",
         json={
             "email": "test@example.com",
@@ -150,7 +159,7 @@ def test_update_user(client: TestClient) -> None:
     user_id = create_response.json()["id"]
 
     # Update the user
-    response = client.patch(
+    response = await ac.patch(
         f"/api/v1/users/{user_id}",
         json={"full_name": "Updated Name", "is_active": False},
     )
@@ -161,16 +170,18 @@ def test_update_user(client: TestClient) -> None:
     assert data["email"] == "test@example.com"  # Unchanged
 
 
-def test_update_user_not_found(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_update_user_not_found(ac: httpx.AsyncClient) -> None:
     """Test updating a non-existent user."""
-    response = client.patch("/api/v1/users/999", json={"full_name": "New Name"})
+    response = await ac.patch("/api/v1/users/999", json={"full_name": "New Name"})
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_delete_user(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_delete_user(ac: httpx.AsyncClient) -> None:
     """Test deleting a user."""
     # Create a user
-    create_response = client.post(
+    create_response = await ac.post(
         "/api/v1/users/",
         json={
             "email": "test@example.com",
@@ -181,15 +192,16 @@ def test_delete_user(client: TestClient) -> None:
     user_id = create_response.json()["id"]
 
     # Delete the user
-    response = client.delete(f"/api/v1/users/{user_id}")
+    response = await ac.delete(f"/api/v1/users/{user_id}")
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
     # Verify deletion
-    get_response = client.get(f"/api/v1/users/{user_id}")
+    get_response = await ac.get(f"/api/v1/users/{user_id}")
     assert get_response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_delete_user_not_found(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_delete_user_not_found(ac: httpx.AsyncClient) -> None:
     """Test deleting a non-existent user."""
-    response = client.delete("/api/v1/users/999")
+    response = await ac.delete("/api/v1/users/999")
     assert response.status_code == status.HTTP_404_NOT_FOUND
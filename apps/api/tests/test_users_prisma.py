@@ -1,32 +1,46 @@
 """Tests for Prisma-based user endpoints."""
 
 from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING
 
 import httpx
-from prisma import Prisma
 import pytest
 import pytest_asyncio
 
-from main import app
+# The Prisma client and the app are imported lazily, so collecting this module does
+# not load them; they are only imported once a fixture here (or conftest's `ac`) runs
+if TYPE_CHECKING:
+    from prisma import Prisma
 
 
-@pytest_asyncio.fixture
-async def prisma_client() -> AsyncGenerator[Prisma, None]:
-    """Create Prisma client for testing and override dependency."""
+@pytest_asyncio.fixture(scope="module")
+async def prisma_ac() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create one HTTP client for the whole module, without conftest's get_db overrides."""
+    from main import app
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def prisma_client(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> AsyncGenerator["Prisma", None]:
+    """Create one Prisma client (and query engine) for the whole test session."""
     import os
     from pathlib import Path
     import subprocess
-    import tempfile
 
+    from my_prisma import PrismaManager
     from routers import users_prisma
 
-    # Create a temporary database file for testing
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        test_db_path = tmp.name
+    # Session-scoped scratch database, managed (and pruned) by pytest
+    test_db_path = tmp_path_factory.mktemp("prisma") / "test.db"
 
-    test_db = f"file:{test_db_path}"
-    original_url = os.environ.get("DATABASE_URL")
-    os.environ["DATABASE_URL"] = test_db
+    # Set once for the session (and inherited by `prisma db push`); never restored
+    os.environ["DATABASE_URL"] = f"file:{test_db_path}"
 
     # Apply Prisma schema to temp database
     schema_path = (
@@ -35,11 +49,8 @@ async def prisma_client() -> AsyncGenerator[Prisma, None]:
         / "prisma"
         / "schema.prisma"
     )
-    env = os.environ.copy()
-    env["DATABASE_URL"] = test_db
     subprocess.run(  # noqa: ASYNC221
         ["prisma", "db", "push", f"--schema={schema_path}", "--skip-generate"],
-        env=env,
         check=True,
         capture_output=True,
     )
@@ -48,45 +59,33 @@ async def prisma_client() -> AsyncGenerator[Prisma, None]:
     await users_prisma.init_prisma()
 
     # Get the initialized client
-    client = await users_prisma.get_prisma_client()
-
-    # Clean up database before test
-    await client.user.delete_many()
+    client = PrismaManager.get()
 
     yield client
 
-    # Clean up database after test
-    await client.user.delete_many()
-
     # Close Prisma client
     await users_prisma.close_prisma()
 
-    # Restore original DATABASE_URL
-    if original_url:
-        os.environ["DATABASE_URL"] = original_url
-    else:
-        os.environ.pop("DATABASE_URL", None)
 
-    # Delete temporary database file
-    Path(test_db_path).unlink(missing_ok=True)
+@pytest_asyncio.fixture(autouse=True)
+async def _prisma_clean(prisma_client: "Prisma") -> None:
+    """Start each test in this module with an empty user table."""
+    await prisma_client.user.delete_many()
 
 
 @pytest.mark.asyncio
-async def test_create_user_prisma(prisma_client: Prisma) -> None:  # noqa: ARG001
+async def test_create_user_prisma(prisma_ac: httpx.AsyncClient) -> None:
     """Test creating a user with Prisma."""
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app), base_url="http://test"
-    ) as ac:
-        response = await ac.post(
-            "/api/v1/prisma/users/",
-            json={
-                "email": "prisma@example.com",
-                "username": "prismauser",
-                "full_name": "Prisma User",
-                "hashed_password": "hashedpass123",
-                "is_active": True,
-            },
-        )
+    response = await prisma_ac.post(
+        "/api/v1/prisma/users/",
+        json={
+            "email": "prisma@example.com",
+            "username": "prismauser",
+            "full_name": "Prisma User",
+            "hashed_password": "hashedpass123",
+            "is_active": True,
+        },
+    )
     assert response.status_code == 201
     data = response.json()
     assert data["email"] == "prisma@example.com"
@@ -96,7 +95,7 @@ async def test_create_user_prisma(prisma_client: Prisma) -> None:  # noqa: ARG00
 
 
 @pytest.mark.asyncio
-async def test_get_user_prisma(prisma_client: Prisma) -> None:
+async def test_get_user_prisma(prisma_client: "Prisma", prisma_ac: httpx.AsyncClient) -> None:
     """Test getting a user by ID with Prisma."""
     # Create a user first
     user = await prisma_client.user.create(
@@ -109,10 +108,7 @@ async def test_get_user_prisma(prisma_client: Prisma) -> None:
         }
     )
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app), base_url="http://test"
-    ) as ac:
-        response = await ac.get(f"/api/v1/prisma/users/{user.id}")
+    response = await prisma_ac.get(f"/api/v1/prisma/users/{user.id}")
 
     assert response.status_code == 200
     data = response.json()
@@ -121,21 +117,16 @@ async def test_get_user_prisma(prisma_client: Prisma) -> None:
 
 
 @pytest.mark.asyncio
-async def test_get_user_not_found_prisma(
-    prisma_client: Prisma,  # noqa: ARG001
-) -> None:
+async def test_get_user_not_found_prisma(prisma_ac: httpx.AsyncClient) -> None:
     """Test getting a non-existent user with Prisma."""
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app), base_url="http://test"
-    ) as ac:
-        response = await ac.get("/api/v1/prisma/users/999999")
+    response = await prisma_ac.get("/api/v1/prisma/users/999999")
 
     assert response.status_code == 404
     assert response.json()["detail"] == "User not found"
 
 
 @pytest.mark.asyncio
-async def test_list_users_prisma(prisma_client: Prisma) -> None:
+async def test_list_users_prisma(prisma_client: "Prisma", prisma_ac: httpx.AsyncClient) -> None:
     """Test listing users with Prisma."""
     # Create multiple users
     await prisma_client.user.create(
@@ -157,10 +148,7 @@ async def test_list_users_prisma(prisma_client: Prisma) -> None:
         }
     )
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app), base_url="http://test"
-    ) as ac:
-        response = await ac.get("/api/v1/prisma/users/")
+    response = await prisma_ac.get("/api/v1/prisma/users/")
 
     assert response.status_code == 200
     data = response.json()
@@ -174,7 +162,7 @@ async def test_list_users_prisma(prisma_client: Prisma) -> None:
 
 
 @pytest.mark.asyncio
-async def test_update_user_prisma(prisma_client: Prisma) -> None:
+async def test_update_user_prisma(prisma_client: "Prisma", prisma_ac: httpx.AsyncClient) -> None:
     """Test updating a user with Prisma."""
     # Create a user first
     user = await prisma_client.user.create(
@@ -187,13 +175,10 @@ async def test_update_user_prisma(prisma_client: Prisma) -> None:
         }
     )
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app), base_url="http://test"
-    ) as ac:
-        response = await ac.patch(
-            f"/api/v1/prisma/users/{user.id}",
-            json={"full_name": "Updated Name", "is_active": False},
-        )
+    response = await prisma_ac.patch(
+        f"/api/v1/prisma/users/{user.id}",
+        json={"full_name": "Updated Name", "is_active": False},
+    )
 
     assert response.status_code == 200
     data = response.json()
@@ -203,7 +188,7 @@ async def test_update_user_prisma(prisma_client: Prisma) -> None:
 
 
 @pytest.mark.asyncio
-async def test_delete_user_prisma(prisma_client: Prisma) -> None:
+async def test_delete_user_prisma(prisma_client: "Prisma", prisma_ac: httpx.AsyncClient) -> None:
     """Test deleting a user with Prisma."""
     # Create a user first
     user = await prisma_client.user.create(
@@ -216,10 +201,7 @@ async def test_delete_user_prisma(prisma_client: Prisma) -> None:
         }
     )
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app), base_url="http://test"
-    ) as ac:
-        response = await ac.delete(f"/api/v1/prisma/users/{user.id}")
+    response = await prisma_ac.delete(f"/api/v1/prisma/users/{user.id}")
 
     assert response.status_code == 204
 
@@ -229,7 +211,9 @@ async def test_delete_user_prisma(prisma_client: Prisma) -> None:
 
 
 @pytest.mark.asyncio
-async def test_create_user_duplicate_email_prisma(prisma_client: Prisma) -> None:
+async def test_create_user_duplicate_email_prisma(
+    prisma_client: "Prisma", prisma_ac: httpx.AsyncClient
+) -> None:
     """Test creating a user with duplicate email using Prisma."""
     # Create first user
     await prisma_client.user.create(
@@ -242,19 +226,16 @@ async def test_create_user_duplicate_email_prisma(prisma_client: Prisma) -> None
         }
     )
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app), base_url="http://test"
-    ) as ac:
-        response = await ac.post(
-            "/api/v1/prisma/users/",
-            json={
-                "email": "duplicate@example.com",
-                "username": "user2",
-                "full_name": "User Two",
-                "hashed_password": "hashedpass123",
-                "is_active": True,
-            },
-        )
+    response = await prisma_ac.post(
+        "/api/v1/prisma/users/",
+        json={
+            "email": "duplicate@example.com",
+            "username": "user2",
+            "full_name": "User Two",
+            "hashed_password": "hashedpass123",
+            "is_active": True,
+        },
+    )
 
     assert response.status_code == 400
     assert "already registered" in response.json()["detail"]
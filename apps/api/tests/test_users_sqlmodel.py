@@ -1,12 +1,47 @@
 """Tests for SQLModel user endpoints."""
 
+import json
+
 from fastapi import status
-from fastapi.testclient import TestClient
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from my_sqlmodel.models import User
+
+SEED_USER_COUNT = 5
+
+# Create payload shared by most tests, encoded once and sent as raw request content
+TEST_USER = {
+    "email": "test@example.com",
+    "username": "testuser",
+    "hashed_password": "hashedpassword123",
+}
+TEST_USER_JSON = json.dumps(TEST_USER).encode()
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@pytest_asyncio.fixture
+async def seed_users(sqlmodel_db: AsyncSession) -> None:
+    """Insert SEED_USER_COUNT users directly, bypassing the API and its validation."""
+    sqlmodel_db.add_all(
+        [
+            User(
+                email=f"test{i}@example.com",
+                username=f"testuser{i}",
+                hashed_password="hashedpassword123",
+            )
+            for i in range(SEED_USER_COUNT)
+        ]
+    )
+    await sqlmodel_db.commit()
 
 
-def test_create_user(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_create_user(ac: httpx.AsyncClient) -> None:
     """Test creating a new user."""
-    response = client.post(
+    response = await ac.post(
         "/api/v1/sqlmodel/users/",
         json={
             "email": "test@example.com",
@@ -25,86 +60,70 @@ def test_create_user(client: TestClient) -> None:
     assert "created_at" in data
 
 
-def test_create_user_duplicate_email(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_create_user_duplicate_email(ac: httpx.AsyncClient) -> None:
     """Test creating a user with duplicate email."""
-    user_data = {
-        "email": "test@example.com",
-        "username": "testuser",
-        "hashed_password": "hashedpassword123",
-    }
     # Create first user
-    client.post("/api/v1/sqlmodel/users/", json=user_data)
+    await ac.post("/api/v1/sqlmodel/users/", content=TEST_USER_JSON, headers=JSON_HEADERS)
 
     # Try to create second user with same email
-    user_data["username"] = "different_username"
-    response = client.post("/api/v1/sqlmodel/users/", json=user_data)
+    response = await ac.post(
+        "/api/v1/sqlmodel/users/", json={**TEST_USER, "username": "different_username"}
+    )
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json()["detail"] == "Email already registered"
 
 
-def test_create_user_duplicate_username(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_create_user_duplicate_username(ac: httpx.AsyncClient) -> None:
     """Test creating a user with duplicate username."""
-    user_data = {
-        "email": "test@example.com",
-        "username": "testuser",
-        "hashed_password": "hashedpassword123",
-    }
     # Create first user
-    client.post("/api/v1/sqlmodel/users/", json=user_data)
+    await ac.post("/api/v1/sqlmodel/users/", content=TEST_USER_JSON, headers=JSON_HEADERS)
 
     # Try to create second user with same username
-    user_data["email"] = "different@example.com"
-    response = client.post("/api/v1/sqlmodel/users/", json=user_data)
+    response = await ac.post(
+        "/api/v1/sqlmodel/users/", json={**TEST_USER, "email": "different@example.com"}
+    )
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json()["detail"] == "Username already taken"
 
 
-def test_get_user(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_get_user(ac: httpx.AsyncClient) -> None:
     """Test getting a user by ID."""
     # Create a user
-    create_response = client.post(
+    create_response = await ac.post(
         "/api/v1/sqlmodel/users/",
-        json={
-            "email": "test@example.com",
-            "username": "testuser",
-            "hashed_password": "hashedpassword123",
-        },
+        content=TEST_USER_JSON,
+        headers=JSON_HEADERS,
     )
     user_id = create_response.json()["id"]
 
     # Get the user
-    response = client.get(f"/api/v1/sqlmodel/users/{user_id}")
+    response = await ac.get(f"/api/v1/sqlmodel/users/{user_id}")
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert data["id"] == user_id
     assert data["email"] == "test@example.com"
 
 
-def test_get_user_not_found(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_get_user_not_found(ac: httpx.AsyncClient) -> None:
     """Test getting a non-existent user."""
-    response = client.get("/api/v1/sqlmodel/users/999")
+    response = await ac.get("/api/v1/sqlmodel/users/999")
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert response.json()["detail"] == "User not found"
 
 
-def test_list_users(client: TestClient) -> None:
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("seed_users")
+async def test_list_users(ac: httpx.AsyncClient) -> None:
     """Test listing all users."""
-    # Create multiple users
-    for i in range(3):
-        client.post(
-            "/api/v1/sqlmodel/users/",
-            json={
-                "email": f"test{i}@example.com",
-                "username": f"testuser{i}",
-                "hashed_password": "hashedpassword123",
-            },
-        )
-
     # List users
-    response = client.get("/api/v1/sqlmodel/users/")
+    response = await ac.get("/api/v1/sqlmodel/users/")
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
-    assert len(data) == 3
+    assert len(data) == SEED_USER_COUNT
     # List response only returns id, username, created_at
     assert "id" in data[0]
     assert "username" in data[0]
@@ -112,21 +131,12 @@ def test_list_users(client: TestClient) -> None:
     assert "email" not in data[0]  # email should not be in list response
 
 
-def test_list_users_pagination(client: TestClient) -> None:
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("seed_users")
+async def test_list_users_pagination(ac: httpx.AsyncClient) -> None:
     """Test listing users with pagination."""
-    # Create multiple users
-    for i in range(5):
-        client.post(
-            "/api/v1/sqlmodel/users/",
-            json={
-                "email": f"test{i}@example.com",
-                "username": f"testuser{i}",
-                "hashed_password": "hashedpassword123",
-            },
-        )
-
     # List with pagination
-    response = client.get("/api/v1/sqlmodel/users/?skip=2&limit=2")
+    response = await ac.get("/api/v1/sqlmodel/users/?skip=2&limit=2")
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert len(data) == 2
@@ -136,21 +146,19 @@ def test_list_users_pagination(client: TestClient) -> None:
     assert "created_at" in data[0]
 
 
-def test_update_user(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_update_user(ac: httpx.AsyncClient) -> None:
     """Test updating a user."""
     # Create a user
-    create_response = client.post(
+    create_response = await ac.post(
         "/api/v1/sqlmodel/users/",
-        json={
-            "email": "test@example.com",
-            "username": "testuser",
-            "hashed_password": "hashedpassword123",
-        },
+        content=TEST_USER_JSON,
+        headers=JSON_HEADERS,
     )
     user_id = create_response.json()["id"]
 
     # Update the user
-    response = client.patch(
+    response = await ac.patch(
         f"/api/v1/sqlmodel/users/{user_id}",
         json={"full_name": "Updated Name", "is_active": False},
     )
@@ -161,35 +169,35 @@ def test_update_user(client: TestClient) -> None:
     assert data["email"] == "test@example.com"  # Unchanged
 
 
-def test_update_user_not_found(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_update_user_not_found(ac: httpx.AsyncClient) -> None:
     """Test updating a non-existent user."""
-    response = client.patch("/api/v1/sqlmodel/users/999", json={"full_name": "New Name"})
+    response = await ac.patch("/api/v1/sqlmodel/users/999", json={"full_name": "New Name"})
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_delete_user(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_delete_user(ac: httpx.AsyncClient) -> None:
     """Test deleting a user."""
     # Create a user
-    create_response = client.post(
+    create_response = await ac.post(
         "/api/v1/sqlmodel/users/",
-        json={
-            "email": "test@example.com",
-            "username": "testuser",
-            "hashed_password": "hashedpassword123",
-        },
+        content=TEST_USER_JSON,
+        headers=JSON_HEADERS,
     )
     user_id = create_response.json()["id"]
 
     # Delete the user
-    response = client.delete(f"/api/v1/sqlmodel/users/{user_id}")
+    response = await ac.delete(f"/api/v1/sqlmodel/users/{user_id}")
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
     # Verify deletion
-    get_response = client.get(f"/api/v1/sqlmodel/users/{user_id}")
+    get_response = await ac.get(f"/api/v1/sqlmodel/users/{user_id}")
     assert get_response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_delete_user_not_found(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_delete_user_not_found(ac: httpx.AsyncClient) -> None:
     """Test deleting a non-existent user."""
-    response = client.delete("/api/v1/sqlmodel/users/999")
+    response = await ac.delete("/api/v1/sqlmodel/users/999")
     assert response.status_code == status.HTTP_404_NOT_FOUND
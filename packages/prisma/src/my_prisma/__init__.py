@@ -1,12 +1,26 @@
 """Prisma client package for database access."""
 
+from typing import TYPE_CHECKING
+
 from prisma import Prisma
 
 from .manager import PrismaManager
 
-# Create Prisma client instance (deprecated, use PrismaManager instead)
-client = Prisma()
+if TYPE_CHECKING:
+    # Prisma client instance (deprecated, use PrismaManager instead)
+    client: Prisma
 
 __all__ = ["Prisma", "PrismaManager", "client"]
 
 # Partial types are available as a submodule: my_prisma.partial_types
+
+
+def __getattr__(name: str) -> Prisma:
+    """Construct the deprecated `client` lazily on first access (PEP 562)."""
+    if name == "client":
+        instance = Prisma()
+        # Bind the module global so later lookups bypass __getattr__
+        globals()["client"] = instance
+        return instance
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,5 +1,7 @@
 """Prisma client lifecycle manager."""
 
+import os
+
 from prisma import Prisma
 
 
@@ -9,8 +11,14 @@ class PrismaManager:
     _client: Prisma | None = None
 
     @classmethod
-    async def init(cls) -> None:
-        """Initialize Prisma client (called from lifespan)."""
+    async def init(cls, database_url: str | None = None) -> None:
+        """Initialize Prisma client (called from lifespan).
+
+        `database_url` is used as the DATABASE_URL default; an explicitly set
+        environment variable takes precedence.
+        """
+        if database_url is not None:
+            os.environ.setdefault("DATABASE_URL", database_url)
         cls._client = Prisma()
         await cls._client.connect()
 
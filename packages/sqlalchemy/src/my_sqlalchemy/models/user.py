@@ -1,15 +1,78 @@
 """User model."""
 
-from datetime import datetime, timezone
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+import sys
 from typing import Any
 
-from sqlalchemy import DateTime, Integer, String, TypeDecorator
+from sqlalchemy import DateTime, Index, Integer, String, TypeDecorator
 from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.types import TypeEngine
 
 from my_sqlalchemy.models.base import Base
 
+_UTC = timezone.utc
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+def _utcnow() -> datetime:
+    """onupdate factory for updated_at (inserts use the _utcnow_ms server default)."""
+    return datetime.now(_UTC)
+
+
+def _identity(value: Any) -> Any:  # noqa: ANN401
+    """Pass values through unchanged (already a datetime, or unknown types)."""
+    return value
+
+
+def _from_ms(value: int) -> datetime:
+    """Unix timestamp in milliseconds (Prisma format) -> aware datetime."""
+    return datetime.fromtimestamp(value * 0.001, tz=_UTC)
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the "Z" suffix and a " " separator natively
+    _parse_iso = datetime.fromisoformat
+else:
+
+    def _parse_iso(value: str) -> datetime:
+        """ISO format string -> datetime."""
+        # Handle SQLite datetime format: "YYYY-MM-DD HH:MM:SS"
+        if "T" not in value:
+            return datetime.fromisoformat(value.replace(" ", "T"))
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Keyed on exact type(value): one dict lookup per cell instead of an isinstance chain
+_RESULT_HANDLERS: dict[type, Callable[[Any], Any]] = {
+    int: _from_ms,
+    str: _parse_iso,
+    datetime: _identity,
+}
+
+
+class _utcnow_ms(FunctionElement[int]):  # noqa: N801
+    """Server-side "now" in the storage format UnixTimestampDateTime reads back."""
+
+    type = Integer()
+    inherit_cache = True
+
+
+@compiles(_utcnow_ms)
+def _compile_utcnow_ms(_element: _utcnow_ms, _compiler: SQLCompiler, **_kw: Any) -> str:  # noqa: ANN401
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(_utcnow_ms, "sqlite")
+def _compile_utcnow_ms_sqlite(_element: _utcnow_ms, _compiler: SQLCompiler, **_kw: Any) -> str:  # noqa: ANN401
+    # SQLite's CURRENT_TIMESTAMP is a text value; store epoch milliseconds like Prisma
+    return "(CAST(ROUND((julianday('now') - 2440587.5) * 86400000) AS INTEGER))"
+
 
 class UnixTimestampDateTime(TypeDecorator):
     """DateTime type that handles both Unix timestamps (from Prisma) and ISO strings.
@@ -35,42 +98,31 @@ class UnixTimestampDateTime(TypeDecorator):
             return None
         # Convert datetime to Unix timestamp in milliseconds for SQLite
         if dialect.name == "sqlite":
-            return int(value.timestamp() * 1000)
+            if value.tzinfo is None:
+                # Naive values keep datetime.timestamp()'s local-time semantics
+                return int(value.timestamp() * 1000)
+            return (value - _EPOCH) // _ONE_MS
         return value  # type: ignore[return-value]
 
     def process_result_value(self, value: Any, dialect: Dialect) -> datetime | None:  # noqa: ARG002, ANN401
         """Convert database value to Python datetime.
 
-        Handles:
+        Dispatches on type(value) through _RESULT_HANDLERS:
         - Unix timestamp in milliseconds (from Prisma): integer -> datetime
         - ISO format string (from SQLAlchemy): string -> datetime
-        - Already datetime object: pass through
+        - Already datetime object (or unknown type): pass through
         """
         if value is None:
             return None
-
-        # If it's already a datetime, return it
-        if isinstance(value, datetime):
-            return value
-
-        # If it's an integer, treat it as Unix timestamp in milliseconds (Prisma format)
-        if isinstance(value, int):
-            return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
-
-        # If it's a string, parse it as ISO format
-        if isinstance(value, str):
-            # Handle SQLite datetime format: "YYYY-MM-DD HH:MM:SS"
-            if "T" not in value:
-                return datetime.fromisoformat(value.replace(" ", "T"))
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-
-        return value
+        return _RESULT_HANDLERS.get(type(value), _identity)(value)
 
 
 class User(Base):
     """User model for authentication and user management."""
 
     __tablename__ = "user"  # Match SQLModel's automatic table name
+    # Covers list_users' (id, username, created_at) select: an index-only scan in id order
+    __table_args__ = (Index("ix_user_list", "id", "username", "created_at"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
@@ -81,13 +133,13 @@ class User(Base):
     is_superuser: Mapped[bool] = mapped_column(default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         UnixTimestampDateTime,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=_utcnow_ms(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         UnixTimestampDateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=_utcnow_ms(),
+        onupdate=_utcnow,
         nullable=False,
     )
 